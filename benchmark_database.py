@@ -16,187 +16,233 @@ Options:
     --password PASS     MySQL password
     --database DB       Database name (default: ecommerce_demo)
     --iterations N      Number of iterations for each test (default: 3)
-    --output FILE       Output report file (default: benchmark_report.html)
+    --output FILE       Output report file, gzip-compressed if it ends in .gz
+                        (default: benchmark_report.html)
+    --parallel N        Number of queries to benchmark concurrently (default: 1)
+    --cache-mode MODE   Server cache handling: cold, warm or mixed (default: warm)
+    --explain           Time queries with EXPLAIN ANALYZE (MySQL 8.0.18+)
+    --no-stats-cache    Always re-read database statistics instead of using the cache
     --help              Show this help message
 """
 
 import argparse
 import getpass
+import gzip
+import os
+import pickle
+import re
 import time
 import datetime
-import statistics
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import NamedTuple
+import numpy as np
 import mysql.connector
-from mysql.connector import Error
+from jinja2 import Environment, FileSystemLoader
+from mysql.connector import Error, pooling
+
+
+class Query(NamedTuple):
+    """A benchmark query and how it should be run"""
+    name: str
+    description: str
+    query: str
+    category: str
+    optional: bool = False  # Skip instead of failing if the query cannot run
+    server_only: bool = False  # Time without transferring result rows
+
 
 # Define benchmark queries
-BENCHMARK_QUERIES = [
-    {
-        "name": "Simple SELECT",
-        "description": "Retrieves all customers",
-        "query": "SELECT * FROM customers LIMIT 1000;",
-        "category": "Basic"
-    },
-    {
-        "name": "Filtered SELECT",
-        "description": "Retrieves active customers",
-        "query": "SELECT * FROM customers WHERE status = 'Active' LIMIT 1000;",
-        "category": "Basic"
-    },
-    {
-        "name": "COUNT",
-        "description": "Counts total number of products",
-        "query": "SELECT COUNT(*) FROM products;",
-        "category": "Basic"
-    },
-    {
-        "name": "Simple JOIN",
-        "description": "Joins customers and orders",
-        "query": "SELECT c.customer_id, c.first_name, c.last_name, o.order_id, o.order_date " +
-                 "FROM customers c JOIN orders o ON c.customer_id = o.customer_id LIMIT 1000;",
-        "category": "Intermediate"
-    },
-    {
-        "name": "Multi-table JOIN",
-        "description": "Joins customers, orders, and order items",
-        "query": "SELECT c.customer_id, c.first_name, c.last_name, o.order_id, oi.product_id, oi.quantity " +
-                 "FROM customers c " +
-                 "JOIN orders o ON c.customer_id = o.customer_id " +
-                 "JOIN order_items oi ON o.order_id = oi.order_id LIMIT 1000;",
-        "category": "Intermediate"
-    },
-    {
-        "name": "Aggregation",
-        "description": "Calculates total sales by customer",
-        "query": "SELECT c.customer_id, c.first_name, c.last_name, SUM(o.total_amount) as total_spent " +
-                 "FROM customers c " +
-                 "JOIN orders o ON c.customer_id = o.customer_id " +
-                 "GROUP BY c.customer_id, c.first_name, c.last_name " +
-                 "ORDER BY total_spent DESC LIMIT 100;",
-        "category": "Intermediate"
-    },
-    {
-        "name": "Subquery",
-        "description": "Finds products with above-average price",
-        "query": "SELECT product_id, name, price FROM products " +
-                 "WHERE price > (SELECT AVG(price) FROM products) " +
-                 "ORDER BY price DESC LIMIT 100;",
-        "category": "Advanced"
-    },
-    {
-        "name": "Complex JOIN with Filtering",
-        "description": "Finds top-rated products with their categories and review stats",
-        "query": "SELECT p.product_id, p.name, c.name as category, " +
-                 "AVG(r.rating) as avg_rating, COUNT(r.review_id) as review_count " +
-                 "FROM products p " +
-                 "JOIN categories c ON p.category_id = c.category_id " +
-                 "JOIN reviews r ON p.product_id = r.product_id " +
-                 "GROUP BY p.product_id, p.name, c.name " +
-                 "HAVING avg_rating >= 4 AND review_count >= 3 " +
-                 "ORDER BY avg_rating DESC, review_count DESC LIMIT 100;",
-        "category": "Advanced"
-    },
-    {
-        "name": "Date Range Query",
-        "description": "Analyzes orders within a date range",
-        "query": "SELECT DATE(order_date) as order_day, COUNT(*) as order_count, " +
-                 "SUM(total_amount) as daily_revenue " +
-                 "FROM orders " +
-                 "WHERE order_date BETWEEN DATE_SUB(NOW(), INTERVAL 90 DAY) AND NOW() " +
-                 "GROUP BY order_day " +
-                 "ORDER BY order_day DESC;",
-        "category": "Advanced"
-    },
-    {
-        "name": "Full Text Search",
-        "description": "Searches product descriptions (requires FULLTEXT index)",
-        "query": "SELECT product_id, name, description FROM products " +
-                 "WHERE MATCH(description) AGAINST('premium quality' IN NATURAL LANGUAGE MODE) LIMIT 100;",
-        "category": "Advanced",
-        "optional": True
-    },
-    {
-        "name": "View Query",
-        "description": "Queries the product_sales_summary view",
-        "query": "SELECT * FROM product_sales_summary ORDER BY total_revenue DESC LIMIT 100;",
-        "category": "View",
-        "optional": True
-    },
-    {
-        "name": "Stored Procedure",
-        "description": "Calls get_product_sales_by_date_range procedure",
-        "query": "CALL get_product_sales_by_date_range(DATE_SUB(NOW(), INTERVAL 30 DAY), NOW());",
-        "category": "Procedure",
-        "optional": True
-    }
-]
+BENCHMARK_QUERIES = (
+    Query(
+        name="Simple SELECT",
+        description="Retrieves all customers",
+        query="SELECT * FROM customers LIMIT 1000;",
+        category="Basic",
+        server_only=True
+    ),
+    Query(
+        name="Filtered SELECT",
+        description="Retrieves active customers",
+        query="SELECT * FROM customers WHERE status = 'Active' LIMIT 1000;",
+        category="Basic",
+        server_only=True
+    ),
+    Query(
+        name="COUNT",
+        description="Counts total number of products",
+        query="SELECT COUNT(*) FROM products;",
+        category="Basic"
+    ),
+    Query(
+        name="Simple JOIN",
+        description="Joins customers and orders",
+        query="SELECT c.customer_id, c.first_name, c.last_name, o.order_id, o.order_date " +
+              "FROM customers c JOIN orders o ON c.customer_id = o.customer_id LIMIT 1000;",
+        category="Intermediate",
+        server_only=True
+    ),
+    Query(
+        name="Multi-table JOIN",
+        description="Joins customers, orders, and order items",
+        query="SELECT c.customer_id, c.first_name, c.last_name, o.order_id, oi.product_id, oi.quantity " +
+              "FROM customers c " +
+              "JOIN orders o ON c.customer_id = o.customer_id " +
+              "JOIN order_items oi ON o.order_id = oi.order_id LIMIT 1000;",
+        category="Intermediate",
+        server_only=True
+    ),
+    Query(
+        name="Aggregation",
+        description="Calculates total sales by customer",
+        query="SELECT c.customer_id, c.first_name, c.last_name, SUM(o.total_amount) as total_spent " +
+              "FROM customers c " +
+              "JOIN orders o ON c.customer_id = o.customer_id " +
+              "GROUP BY c.customer_id, c.first_name, c.last_name " +
+              "ORDER BY total_spent DESC LIMIT 100;",
+        category="Intermediate"
+    ),
+    Query(
+        name="Subquery",
+        description="Finds products with above-average price",
+        query="SELECT product_id, name, price FROM products " +
+              "WHERE price > (SELECT AVG(price) FROM products) " +
+              "ORDER BY price DESC LIMIT 100;",
+        category="Advanced"
+    ),
+    Query(
+        name="Complex JOIN with Filtering",
+        description="Finds top-rated products with their categories and review stats",
+        query="SELECT p.product_id, p.name, c.name as category, " +
+              "AVG(r.rating) as avg_rating, COUNT(r.review_id) as review_count " +
+              "FROM products p " +
+              "JOIN categories c ON p.category_id = c.category_id " +
+              "JOIN reviews r ON p.product_id = r.product_id " +
+              "GROUP BY p.product_id, p.name, c.name " +
+              "HAVING avg_rating >= 4 AND review_count >= 3 " +
+              "ORDER BY avg_rating DESC, review_count DESC LIMIT 100;",
+        category="Advanced"
+    ),
+    Query(
+        name="Date Range Query",
+        description="Analyzes orders within a date range",
+        query="SELECT DATE(order_date) as order_day, COUNT(*) as order_count, " +
+              "SUM(total_amount) as daily_revenue " +
+              "FROM orders " +
+              "WHERE order_date BETWEEN DATE_SUB(NOW(), INTERVAL 90 DAY) AND NOW() " +
+              "GROUP BY order_day " +
+              "ORDER BY order_day DESC;",
+        category="Advanced"
+    ),
+    Query(
+        name="Full Text Search",
+        description="Searches product descriptions (requires FULLTEXT index)",
+        query="SELECT product_id, name, description FROM products " +
+              "WHERE MATCH(description) AGAINST('premium quality' IN NATURAL LANGUAGE MODE) LIMIT 100;",
+        category="Advanced",
+        optional=True
+    ),
+    Query(
+        name="View Query",
+        description="Queries the product_sales_summary view",
+        query="SELECT * FROM product_sales_summary ORDER BY total_revenue DESC LIMIT 100;",
+        category="View",
+        optional=True
+    ),
+    Query(
+        name="Stored Procedure",
+        description="Calls get_product_sales_by_date_range procedure",
+        query="CALL get_product_sales_by_date_range(DATE_SUB(NOW(), INTERVAL 30 DAY), NOW());",
+        category="Procedure",
+        optional=True
+    )
+)
 
 # Define optimization suggestions based on query performance
-OPTIMIZATION_SUGGESTIONS = {
-    "Simple SELECT": [
+OPTIMIZATION_SUGGESTIONS = MappingProxyType({
+    "Simple SELECT": (
         "Ensure proper indexing on frequently queried columns",
         "Consider using column-specific SELECT instead of SELECT *",
         "Check if table partitioning would help for very large tables"
-    ],
-    "Filtered SELECT": [
+    ),
+    "Filtered SELECT": (
         "Add an index on the status column if not already present",
         "Consider using ENUM type for status fields to save space",
         "Verify that the WHERE clause uses indexed columns"
-    ],
-    "COUNT": [
+    ),
+    "COUNT": (
         "For approximate counts, consider using information_schema.tables",
         "For large tables, maintain a separate counter table that's updated with triggers",
         "Use COUNT(1) instead of COUNT(*) for slight performance improvement"
-    ],
-    "Simple JOIN": [
+    ),
+    "Simple JOIN": (
         "Ensure foreign keys are properly indexed",
         "Check join order optimization in EXPLAIN plan",
         "Consider denormalizing frequently joined data for read-heavy operations"
-    ],
-    "Multi-table JOIN": [
+    ),
+    "Multi-table JOIN": (
         "Ensure all join columns are indexed",
         "Consider creating composite indexes for multi-column joins",
         "Use EXPLAIN to verify the join order and optimization",
         "For reporting queries, consider materialized views or summary tables"
-    ],
-    "Aggregation": [
+    ),
+    "Aggregation": (
         "Add indexes on grouped columns and columns in the WHERE clause",
         "Consider pre-aggregating data for common aggregation queries",
         "Use HAVING only for filtering on aggregated values, not for row filtering"
-    ],
-    "Subquery": [
+    ),
+    "Subquery": (
         "Check if the subquery can be rewritten as a JOIN for better performance",
         "Use EXPLAIN to verify if the subquery is materialized or executed for each row",
         "Consider using a derived table or CTE instead of a subquery"
-    ],
-    "Complex JOIN with Filtering": [
+    ),
+    "Complex JOIN with Filtering": (
         "Ensure all join columns and filtered columns are indexed",
         "Consider creating a summary table for this specific query pattern",
         "Use EXPLAIN to identify bottlenecks in the execution plan",
         "Consider breaking down the query into smaller parts using temporary tables"
-    ],
-    "Date Range Query": [
+    ),
+    "Date Range Query": (
         "Ensure the order_date column is indexed",
         "Consider partitioning large tables by date ranges",
         "Pre-aggregate historical data for faster reporting"
-    ],
-    "Full Text Search": [
+    ),
+    "Full Text Search": (
         "Add a FULLTEXT index on the description column",
         "Consider using a dedicated search engine like Elasticsearch for complex text search",
         "Optimize FULLTEXT index settings based on your content"
-    ],
-    "View Query": [
+    ),
+    "View Query": (
         "Consider materializing complex views for better performance",
         "Ensure the underlying tables in the view are properly indexed",
         "Monitor view performance and consider rewriting as a stored procedure if needed"
-    ],
-    "Stored Procedure": [
+    ),
+    "Stored Procedure": (
         "Optimize the internal queries within the stored procedure",
         "Consider caching procedure results for frequent calls with the same parameters",
         "Use proper parameter types and validate inputs to avoid performance issues"
-    ]
+    )
+})
+
+# Directory where database statistics are cached between runs
+STATS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "db-bench")
+
+# Columns of the combined table/index statistics query that belong to each part
+TABLE_STAT_COLUMNS = ("table_name", "table_rows", "data_length", "index_length",
+                      "data_free", "create_time", "update_time")
+INDEX_STAT_COLUMNS = ("table_name", "index_name", "column_name", "seq_in_index", "non_unique")
+
+# Chart.js background and border colors for each performance class
+CHART_COLORS = {
+    "slow": ("rgba(255, 99, 132, 0.2)", "rgb(255, 99, 132)"),
+    "medium": ("rgba(255, 205, 86, 0.2)", "rgb(255, 205, 86)"),
+    "fast": ("rgba(75, 192, 192, 0.2)", "rgb(75, 192, 192)")
 }
 
+# Units used when formatting byte sizes, each 1024 times the previous one
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
 # General database optimization suggestions
 GENERAL_SUGGESTIONS = [
     "Ensure InnoDB buffer pool size is set appropriately (typically 70-80% of available memory)",
@@ -229,141 +275,340 @@ def connect_to_database(host, port, user, password, database):
         sys.exit(1)
 
 
-def run_benchmark(connection, iterations=3):
-    """Run benchmark queries and measure performance"""
-    results = []
+def create_connection_pool(host, port, user, password, database, pool_size):
+    """Create a pool of MySQL connections for parallel benchmarking"""
+    try:
+        return pooling.MySQLConnectionPool(
+            pool_name="benchmark",
+            pool_size=pool_size,
+            host=host,
+            port=port,
+            user=user,
+            password=password,
+            database=database
+        )
+    except Error as e:
+        print(f"Error creating MySQL connection pool: {e}")
+        sys.exit(1)
+
+
+def bypass_query_cache(query):
+    """Add SQL_NO_CACHE to a SELECT so the server query cache cannot answer it"""
+    stripped = query.lstrip()
+    if stripped[:7].upper() == "SELECT ":
+        return "SELECT SQL_NO_CACHE " + stripped[7:]
+    return query
+
+
+def count_on_server(query):
+    """Wrap a SELECT so the server runs it in full but only returns its row count"""
+    return f"SELECT COUNT(*) FROM ({query.rstrip().rstrip(';')}) AS benchmark_rows"
+
+
+def read_row_count(cursor, server_only):
+    """Consume the pending result of a benchmark statement and return its row count"""
+    return cursor.fetchall()[0][0] if server_only else count_rows(cursor)
+
+
+def count_rows(cursor, batch_size=1000):
+    """Stream the pending result set in batches and return its row count"""
+    row_count = 0
+    while batch := cursor.fetchmany(batch_size):
+        row_count += len(batch)
+    return row_count
+
+
+def flush_caches(connection, progress):
+    """Flush server-side caches so the next query execution runs cold
+    
+    Returns False if the tables could not be flushed (e.g., the user lacks the
+    RELOAD privilege), in which case the next execution is not cold. Errors are
+    appended to the progress lines of the query being benchmarked.
+    """
     cursor = connection.cursor()
+    try:
+        try:
+            cursor.execute("RESET QUERY CACHE")
+        except Error:
+            pass  # The query cache was removed in MySQL 8.0
+        try:
+            cursor.execute("FLUSH TABLES")
+        except Error as e:
+            progress.append(f"  Error flushing tables: {e}")
+            return False
+        return True
+    finally:
+        cursor.close()
+
+
+def explain_analyze(connection, query, progress):
+    """Run EXPLAIN ANALYZE on a query and return the plan and its execution time
     
-    for query_info in BENCHMARK_QUERIES:
-        query_name = query_info["name"]
-        query = query_info["query"]
-        optional = query_info.get("optional", False)
-        
-        print(f"Running benchmark: {query_name}")
-        
-        # Skip optional queries if they fail (e.g., missing FULLTEXT index)
-        if optional:
+    The time is the top-level "actual time" reported by the server, in seconds.
+    Requires MySQL 8.0.18 or later; (None, None) is returned if unavailable and
+    the error is appended to the progress lines of the query being benchmarked.
+    """
+    cursor = connection.cursor(buffered=True)
+    try:
+        cursor.execute("EXPLAIN ANALYZE " + query)
+        plan_text = cursor.fetchone()[0]
+    except Error as e:
+        progress.append(f"  EXPLAIN ANALYZE not available: {e}")
+        return None, None
+    finally:
+        cursor.close()
+    
+    # The first node is the root of the plan; its second actual time is the
+    # time in milliseconds until it returned its last row
+    match = re.search(r"actual time=[\d.]+\.\.([\d.]+)", plan_text)
+    plan_time = float(match.group(1)) / 1000 if match else None
+    return plan_text, plan_time
+
+
+def benchmark_query(connection, query_info, iterations=3, cache_mode="warm", explain=False):
+    """Run a single benchmark query and measure its performance
+    
+    cache_mode controls how server caches are treated:
+        cold  - caches are flushed before every iteration
+        warm  - an untimed warm-up run precedes the recorded iterations
+        mixed - caches are flushed once, so only the first iteration runs cold
+    
+    With explain, the query time is taken from a single EXPLAIN ANALYZE run and
+    the query itself is executed only once, to count the rows it returns. In
+    warm mode that execution is the warm-up run, so EXPLAIN ANALYZE runs warm;
+    otherwise caches are flushed before EXPLAIN ANALYZE so it runs cold.
+    """
+    query_name = query_info.name
+    query = query_info.query
+    optional = query_info.optional
+    server_only = query_info.server_only
+    # Queries marked server_only are timed without transferring their rows
+    statement = bypass_query_cache(count_on_server(query) if server_only else query)
+    
+    # Progress lines are collected and printed together once the query is done,
+    # in a single write, keeping console output out of the timing loop and
+    # unmixed across threads
+    progress = [f"Running benchmark: {query_name}"]
+    
+    # Server-side prepared statement: the query is parsed and planned once on the
+    # first execute and the handle is reused by every later iteration. A fresh
+    # cursor per query keeps prepared statements from piling up on the connection.
+    cursor = connection.cursor(prepared=True)
+    try:
+        # Optional queries are skipped if their first execution fails (e.g.,
+        # missing FULLTEXT index), so no separate test run is needed. In warm
+        # mode that first execution is the warm-up run, so optional queries run
+        # iterations + 1 times like every other query; in cold and mixed modes
+        # they run exactly iterations times.
+        warmup_rows = None
+        if cache_mode == "warm":
+            # Untimed warm-up pass so the first recorded iteration is not skewed
             try:
-                cursor.execute(query)
-                cursor.fetchall()  # Test if query works
+                cursor.execute(statement)
+                warmup_rows = read_row_count(cursor, server_only)
             except Error as e:
-                print(f"  Skipping optional query '{query_name}': {e}")
-                continue
+                if optional:
+                    progress.append(f"  Skipping optional query '{query_name}': {e}")
+                else:
+                    progress.append(f"  Error executing query: {e}")
+                return None
         
         execution_times = []
+        cold_times = []
+        warm_times = []
         row_counts = []
         
+        plan_text, plan_time, plan_cold = None, None, False
+        if explain:
+            plan_cold = cache_mode != "warm" and flush_caches(connection, progress)
+            plan_text, plan_time = explain_analyze(connection, query, progress)
+        
+        if plan_time is not None:
+            # The plan time is authoritative; the query only needs to run once
+            # for its row count, which the warm-up run has done in warm mode
+            row_count = warmup_rows
+            if row_count is None:
+                try:
+                    cursor.execute(statement)
+                    row_count = read_row_count(cursor, server_only)
+                except Error as e:
+                    progress.append(f"  Error executing query: {e}")
+                    return None
+            
+            execution_times.append(plan_time)
+            (cold_times if plan_cold else warm_times).append(plan_time)
+            row_counts.append(row_count)
+            progress.append(f"  EXPLAIN ANALYZE ({'cold' if plan_cold else 'warm'}): "
+                            f"{plan_time:.4f} seconds, {row_count} rows")
+            iterations = 0
+        
+        first_iter = True
         for i in range(iterations):
+            # An iteration only counts as cold if the caches were actually flushed
+            cold = ((cache_mode == "cold" or (cache_mode == "mixed" and i == 0))
+                    and flush_caches(connection, progress))
+            
             try:
-                start_time = time.time()
-                cursor.execute(query)
-                rows = cursor.fetchall()
-                end_time = time.time()
+                start_time = time.perf_counter_ns()
+                cursor.execute(statement)
+                row_count = read_row_count(cursor, server_only)
+                end_time = time.perf_counter_ns()
                 
-                execution_time = end_time - start_time
-                row_count = len(rows)
+                execution_time = (end_time - start_time) / 1e9
                 
                 execution_times.append(execution_time)
+                (cold_times if cold else warm_times).append(execution_time)
                 row_counts.append(row_count)
                 
-                print(f"  Iteration {i+1}: {execution_time:.4f} seconds, {row_count} rows")
+                progress.append(f"  Iteration {i+1} ({'cold' if cold else 'warm'}): "
+                                f"{execution_time:.4f} seconds, {row_count} rows")
+                first_iter = False
                 
             except Error as e:
-                print(f"  Error executing query: {e}")
+                if optional and first_iter:
+                    progress.append(f"  Skipping optional query '{query_name}': {e}")
+                    return None
+                progress.append(f"  Error executing query: {e}")
                 if not optional:
                     execution_times.append(None)
                     row_counts.append(None)
                 break
+    finally:
+        cursor.close()
+        sys.stdout.write("\n".join(progress) + "\n")
+    
+    # Calculate statistics if we have valid execution times
+    valid_times = [t for t in execution_times if t is not None]
+    if not valid_times:
+        return None
+    
+    times = np.asarray(valid_times)
+    avg_time = float(times.mean())
+    min_time = float(times.min())
+    max_time = float(times.max())
+    std_dev = float(times.std(ddof=1)) if times.size > 1 else 0.0
+    
+    valid_counts = [rc for rc in row_counts if rc is not None]
+    
+    return {
+        "name": query_name,
+        "description": query_info.description,
+        "query": query,
+        "statement": statement,
+        "server_only": server_only and plan_time is None,  # EXPLAIN times the original query
+        "category": query_info.category,
+        "avg_time": avg_time,
+        "min_time": min_time,
+        "max_time": max_time,
+        "std_dev": std_dev,
+        "cold_time": float(np.mean(cold_times)) if cold_times else None,
+        "warm_time": float(np.mean(warm_times)) if warm_times else None,
+        "row_count": float(np.mean(valid_counts)) if valid_counts else 0,
+        "iterations": len(valid_times),
+        "plan_text": plan_text,
+        "plan_time": plan_time,
+        "suggestions": OPTIMIZATION_SUGGESTIONS.get(query_name, ())
+    }
+
+
+def run_benchmark(connection, iterations=3, pool=None, cache_mode="warm", explain=False):
+    """Run benchmark queries and measure performance
+    
+    If a connection pool is given, queries are benchmarked concurrently, each
+    on its own pooled connection, instead of serially on the single connection.
+    """
+    if pool is None:
+        results = [benchmark_query(connection, query_info, iterations, cache_mode, explain)
+                   for query_info in BENCHMARK_QUERIES]
+    else:
+        def run_pooled(query_info):
+            pooled_connection = pool.get_connection()
+            try:
+                return benchmark_query(pooled_connection, query_info, iterations, cache_mode, explain)
+            finally:
+                pooled_connection.close()  # Returns the connection to the pool
         
-        # Calculate statistics if we have valid execution times
-        valid_times = [t for t in execution_times if t is not None]
-        if valid_times:
-            avg_time = statistics.mean(valid_times)
-            min_time = min(valid_times)
-            max_time = max(valid_times)
-            if len(valid_times) > 1:
-                std_dev = statistics.stdev(valid_times)
-            else:
-                std_dev = 0
-                
-            results.append({
-                "name": query_name,
-                "description": query_info["description"],
-                "query": query,
-                "category": query_info["category"],
-                "avg_time": avg_time,
-                "min_time": min_time,
-                "max_time": max_time,
-                "std_dev": std_dev,
-                "row_count": statistics.mean(row_counts) if any(rc is not None for rc in row_counts) else 0,
-                "iterations": len(valid_times),
-                "suggestions": OPTIMIZATION_SUGGESTIONS.get(query_name, [])
-            })
+        with ThreadPoolExecutor(max_workers=pool.pool_size) as executor:
+            results = list(executor.map(run_pooled, BENCHMARK_QUERIES))
     
-    cursor.close()
-    return results
+    return [result for result in results if result is not None]
 
 
 def get_database_stats(connection):
     """Get database statistics"""
+    stats = get_schema_stats(connection)
+    stats.update(get_server_variables(connection))
+    return stats
+
+
+def get_schema_stats(connection):
+    """Get table and index statistics for the current schema"""
     stats = {}
     cursor = connection.cursor(dictionary=True)
     
-    # Get table statistics
+    # Get table and index statistics in one pass over information_schema; each
+    # table appears once per index column, or once with NULL index fields
     try:
         cursor.execute("""
             SELECT 
-                table_name, 
-                table_rows, 
-                data_length, 
-                index_length,
-                data_free,
-                create_time,
-                update_time
+                t.table_name AS table_name, 
+                t.table_rows AS table_rows, 
+                t.data_length AS data_length, 
+                t.index_length AS index_length,
+                t.data_free AS data_free,
+                t.create_time AS create_time,
+                t.update_time AS update_time,
+                s.index_name AS index_name, 
+                s.column_name AS column_name,
+                s.seq_in_index AS seq_in_index,
+                s.non_unique AS non_unique
             FROM 
-                information_schema.tables 
+                information_schema.tables t
+                LEFT JOIN information_schema.statistics s
+                    ON s.table_schema = t.table_schema AND s.table_name = t.table_name
             WHERE 
-                table_schema = DATABASE()
+                t.table_schema = DATABASE()
+            ORDER BY 
+                t.table_name, s.index_name, s.seq_in_index
         """)
-        stats["tables"] = cursor.fetchall()
+        tables = {}
+        indexes = []
+        for row in cursor.fetchall():
+            table_name = row["table_name"]
+            if table_name not in tables:
+                tables[table_name] = {column: row[column] for column in TABLE_STAT_COLUMNS}
+            if row["index_name"] is not None:
+                indexes.append({column: row[column] for column in INDEX_STAT_COLUMNS})
+        stats["tables"] = list(tables.values())
+        stats["indexes"] = indexes
     except Error as e:
-        print(f"Error getting table statistics: {e}")
+        print(f"Error getting table and index statistics: {e}")
         stats["tables"] = []
+        stats["indexes"] = []
+    
+    cursor.close()
+    return stats
+
+
+def get_server_variables(connection):
+    """Get the server variables shown in the report"""
+    stats = {}
+    cursor = connection.cursor(dictionary=True)
     
-    # Get index statistics
     try:
         cursor.execute("""
             SELECT 
-                table_name, 
-                index_name, 
-                column_name,
-                seq_in_index,
-                non_unique
+                VARIABLE_NAME, 
+                VARIABLE_VALUE
             FROM 
-                information_schema.statistics 
+                performance_schema.global_variables 
             WHERE 
-                table_schema = DATABASE()
-            ORDER BY 
-                table_name, index_name, seq_in_index
+                VARIABLE_NAME IN ('innodb_buffer_pool_size', 'max_connections', 'query_cache_size')
         """)
-        stats["indexes"] = cursor.fetchall()
-    except Error as e:
-        print(f"Error getting index statistics: {e}")
-        stats["indexes"] = []
-    
-    # Get server variables
-    try:
-        cursor.execute("SHOW VARIABLES LIKE 'innodb_buffer_pool_size'")
-        buffer_pool = cursor.fetchone()
-        stats["buffer_pool_size"] = int(buffer_pool["Value"]) if buffer_pool else 0
-        
-        cursor.execute("SHOW VARIABLES LIKE 'max_connections'")
-        max_conn = cursor.fetchone()
-        stats["max_connections"] = int(max_conn["Value"]) if max_conn else 0
-        
-        cursor.execute("SHOW VARIABLES LIKE 'query_cache_size'")
-        query_cache = cursor.fetchone()
-        stats["query_cache_size"] = int(query_cache["Value"]) if query_cache else 0
+        variables = {row["VARIABLE_NAME"].lower(): int(row["VARIABLE_VALUE"]) for row in cursor.fetchall()}
+        stats["buffer_pool_size"] = variables.get("innodb_buffer_pool_size", 0)
+        stats["max_connections"] = variables.get("max_connections", 0)
+        stats["query_cache_size"] = variables.get("query_cache_size", 0)  # Removed in MySQL 8.0
     except Error as e:
         print(f"Error getting server variables: {e}")
     
@@ -371,421 +616,182 @@ def get_database_stats(connection):
     return stats
 
 
-def generate_report(results, stats, output_file):
-    """Generate HTML benchmark report"""
-    # Sort results by average execution time (slowest first)
-    sorted_results = sorted(results, key=lambda x: x["avg_time"], reverse=True)
-    
-    # Group results by category
-    categorized_results = {}
-    for result in results:
-        category = result["category"]
-        if category not in categorized_results:
-            categorized_results[category] = []
-        categorized_results[category].append(result)
-    
-    # Calculate total data size
-    total_data_size = sum(table["data_length"] + table["index_length"] for table in stats["tables"])
+def get_schema_fingerprint(connection):
+    """Get a cheap fingerprint of the current schema's tables
     
-    # Generate HTML report
-    html = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>MySQL Database Benchmark Report</title>
-        <style>
-            body {{
-                font-family: Arial, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 1200px;
-                margin: 0 auto;
-                padding: 20px;
-            }}
-            h1, h2, h3 {{
-                color: #2c3e50;
-            }}
-            h1 {{
-                text-align: center;
-                margin-bottom: 30px;
-            }}
-            h2 {{
-                border-bottom: 1px solid #eee;
-                padding-bottom: 10px;
-                margin-top: 30px;
-            }}
-            table {{
-                width: 100%;
-                border-collapse: collapse;
-                margin-bottom: 20px;
-            }}
-            th, td {{
-                padding: 12px 15px;
-                border: 1px solid #ddd;
-                text-align: left;
-            }}
-            th {{
-                background-color: #f8f9fa;
-                font-weight: bold;
-            }}
-            tr:nth-child(even) {{
-                background-color: #f2f2f2;
-            }}
-            .slow {{
-                background-color: #ffcccc;
-            }}
-            .medium {{
-                background-color: #ffffcc;
-            }}
-            .fast {{
-                background-color: #ccffcc;
-            }}
-            .chart-container {{
-                height: 400px;
-                margin-bottom: 30px;
-            }}
-            .suggestion {{
-                background-color: #f8f9fa;
-                border-left: 4px solid #3498db;
-                padding: 10px 15px;
-                margin-bottom: 10px;
-            }}
-            .suggestion-list {{
-                margin-top: 5px;
-                margin-bottom: 5px;
-            }}
-            .query {{
-                font-family: monospace;
-                background-color: #f8f9fa;
-                padding: 10px;
-                border: 1px solid #ddd;
-                overflow-x: auto;
-                white-space: pre-wrap;
-            }}
-            .summary-box {{
-                background-color: #f8f9fa;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                padding: 15px;
-                margin-bottom: 20px;
-            }}
-            .summary-item {{
-                display: inline-block;
-                margin-right: 30px;
-                margin-bottom: 10px;
-            }}
-            .summary-label {{
-                font-weight: bold;
-                color: #7f8c8d;
-            }}
-            .summary-value {{
-                font-size: 1.2em;
-                font-weight: bold;
-                color: #2c3e50;
-            }}
-            .footer {{
-                margin-top: 50px;
-                text-align: center;
-                color: #7f8c8d;
-                font-size: 0.9em;
-            }}
-        </style>
-        <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    </head>
-    <body>
-        <h1>MySQL Database Benchmark Report</h1>
-        <p>Report generated on {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        
-        <div class="summary-box">
-            <h3>Summary</h3>
-            <div>
-                <div class="summary-item">
-                    <div class="summary-label">Total Queries Tested</div>
-                    <div class="summary-value">{len(results)}</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-label">Slowest Query</div>
-                    <div class="summary-value">{sorted_results[0]['name'] if sorted_results else 'N/A'}</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-label">Fastest Query</div>
-                    <div class="summary-value">{sorted_results[-1]['name'] if sorted_results else 'N/A'}</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-label">Total Tables</div>
-                    <div class="summary-value">{len(stats['tables'])}</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-label">Total Database Size</div>
-                    <div class="summary-value">{format_size(total_data_size)}</div>
-                </div>
-                <div class="summary-item">
-                    <div class="summary-label">Buffer Pool Size</div>
-                    <div class="summary-value">{format_size(stats.get('buffer_pool_size', 0))}</div>
-                </div>
-            </div>
-        </div>
-        
-        <h2>Performance Overview</h2>
-        <div class="chart-container">
-            <canvas id="queryPerformanceChart"></canvas>
-        </div>
-        
-        <h2>Query Performance Results</h2>
+    The fingerprint changes when tables are created, dropped, altered or
+    (where the engine tracks it) updated. It deliberately reads only
+    information_schema.tables: scanning information_schema.statistics here
+    would cost as much as the scan the cache exists to skip. Index changes
+    that leave the table timestamps untouched can be picked up with
+    --no-stats-cache.
     """
+    cursor = connection.cursor()
+    try:
+        cursor.execute("""
+            SELECT 
+                COUNT(*), 
+                MAX(create_time), 
+                MAX(update_time)
+            FROM 
+                information_schema.tables 
+            WHERE 
+                table_schema = DATABASE()
+        """)
+        return tuple(cursor.fetchone())
+    finally:
+        cursor.close()
+
+
+def get_cached_database_stats(connection, host, port, database, use_cache=True):
+    """Get database statistics, reusing cached schema statistics while the schema is unchanged
     
-    # Add results by category
-    for category, category_results in categorized_results.items():
-        # Sort by average execution time (slowest first)
-        category_results = sorted(category_results, key=lambda x: x["avg_time"], reverse=True)
-        
-        html += f"""
-        <h3>{category} Queries</h3>
-        <table>
-            <thead>
-                <tr>
-                    <th>Query</th>
-                    <th>Description</th>
-                    <th>Avg Time (s)</th>
-                    <th>Min Time (s)</th>
-                    <th>Max Time (s)</th>
-                    <th>Std Dev</th>
-                    <th>Rows</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        for result in category_results:
-            # Determine performance class based on average time
-            perf_class = ""
-            if result["avg_time"] > 1.0:
-                perf_class = "slow"
-            elif result["avg_time"] > 0.1:
-                perf_class = "medium"
-            else:
-                perf_class = "fast"
-            
-            html += f"""
-                <tr class="{perf_class}">
-                    <td>{result['name']}</td>
-                    <td>{result['description']}</td>
-                    <td>{result['avg_time']:.4f}</td>
-                    <td>{result['min_time']:.4f}</td>
-                    <td>{result['max_time']:.4f}</td>
-                    <td>{result['std_dev']:.4f}</td>
-                    <td>{int(result['row_count'])}</td>
-                </tr>
-            """
-        
-        html += """
-            </tbody>
-        </table>
-        """
-    
-    # Add detailed query analysis
-    html += """
-        <h2>Detailed Query Analysis</h2>
+    Only the table and index statistics are cached; server variables are read
+    on every run since they may be changed while tuning.
     """
+    cache_name = re.sub(r"[^\w.-]", "_", f"{host}_{port}_{database}")
+    cache_file = os.path.join(STATS_CACHE_DIR, f"{cache_name}.pkl")
     
-    for result in sorted_results:
-        html += f"""
-        <h3>{result['name']}</h3>
-        <p>{result['description']}</p>
-        
-        <div class="query">{result['query']}</div>
-        
-        <p><strong>Performance:</strong> {result['avg_time']:.4f} seconds (avg), {result['min_time']:.4f} seconds (min), {result['max_time']:.4f} seconds (max)</p>
-        
-        <h4>Optimization Suggestions</h4>
-        <div class="suggestion-list">
-        """
-        
-        for suggestion in result["suggestions"]:
-            html += f"""
-            <div class="suggestion">{suggestion}</div>
-            """
-        
-        html += """
-        </div>
-        """
+    try:
+        fingerprint = get_schema_fingerprint(connection)
+    except Error as e:
+        print(f"Error getting schema fingerprint: {e}")
+        return get_database_stats(connection)
     
-    # Add database statistics
-    html += """
-        <h2>Database Statistics</h2>
-        
-        <h3>Table Statistics</h3>
-        <table>
-            <thead>
-                <tr>
-                    <th>Table Name</th>
-                    <th>Rows</th>
-                    <th>Data Size</th>
-                    <th>Index Size</th>
-                    <th>Total Size</th>
-                    <th>Created</th>
-                    <th>Last Updated</th>
-                </tr>
-            </thead>
-            <tbody>
-    """
+    stats = get_server_variables(connection)
     
-    for table in sorted(stats["tables"], key=lambda x: x["table_name"]):
-        data_size = table["data_length"]
-        index_size = table["index_length"]
-        total_size = data_size + index_size
-        
-        html += f"""
-                <tr>
-                    <td>{table['table_name']}</td>
-                    <td>{table['table_rows'] or 0}</td>
-                    <td>{format_size(data_size)}</td>
-                    <td>{format_size(index_size)}</td>
-                    <td>{format_size(total_size)}</td>
-                    <td>{table['create_time'].strftime('%Y-%m-%d %H:%M:%S') if table['create_time'] else 'N/A'}</td>
-                    <td>{table['update_time'].strftime('%Y-%m-%d %H:%M:%S') if table['update_time'] else 'N/A'}</td>
-                </tr>
-        """
-    
-    html += """
-            </tbody>
-        </table>
-        
-        <h3>Index Statistics</h3>
-        <table>
-            <thead>
-                <tr>
-                    <th>Table Name</th>
-                    <th>Index Name</th>
-                    <th>Column Name</th>
-                    <th>Sequence</th>
-                    <th>Type</th>
-                </tr>
-            </thead>
-            <tbody>
-    """
+    if use_cache:
+        try:
+            with open(cache_file, "rb") as f:
+                cached_fingerprint, schema_stats = pickle.load(f)
+            if cached_fingerprint == fingerprint:
+                print(f"Using cached schema statistics from {cache_file}")
+                stats.update(schema_stats)
+                return stats
+        except FileNotFoundError:
+            pass
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError) as e:
+            print(f"Ignoring unreadable statistics cache {cache_file}: {e}")
     
-    for index in sorted(stats["indexes"], key=lambda x: (x["table_name"], x["index_name"], x["seq_in_index"])):
-        index_type = "Non-unique" if index["non_unique"] == 1 else "Unique"
-        if index["index_name"] == "PRIMARY":
-            index_type = "Primary Key"
-        
-        html += f"""
-                <tr>
-                    <td>{index['table_name']}</td>
-                    <td>{index['index_name']}</td>
-                    <td>{index['column_name']}</td>
-                    <td>{index['seq_in_index']}</td>
-                    <td>{index_type}</td>
-                </tr>
-        """
-    
-    html += """
-            </tbody>
-        </table>
-        
-        <h2>General Optimization Suggestions</h2>
-        <div class="suggestion-list">
-    """
+    schema_stats = get_schema_stats(connection)
     
-    for suggestion in GENERAL_SUGGESTIONS:
-        html += f"""
-        <div class="suggestion">{suggestion}</div>
-        """
+    try:
+        os.makedirs(STATS_CACHE_DIR, exist_ok=True)
+        with open(cache_file, "wb") as f:
+            pickle.dump((fingerprint, schema_stats), f)
+    except OSError as e:
+        print(f"Error writing statistics cache {cache_file}: {e}")
     
-    html += """
-        </div>
-        
-        <script>
-            // Create performance chart
-            const ctx = document.getElementById('queryPerformanceChart').getContext('2d');
-            const chart = new Chart(ctx, {
-                type: 'bar',
-                data: {
-                    labels: [%s],
-                    datasets: [{
-                        label: 'Average Execution Time (seconds)',
-                        data: [%s],
-                        backgroundColor: [%s],
-                        borderColor: [%s],
-                        borderWidth: 1
-                    }]
-                },
-                options: {
-                    indexAxis: 'y',
-                    scales: {
-                        x: {
-                            beginAtZero: true,
-                            title: {
-                                display: true,
-                                text: 'Execution Time (seconds)'
-                            }
-                        }
-                    },
-                    plugins: {
-                        legend: {
-                            display: false
-                        },
-                        tooltip: {
-                            callbacks: {
-                                label: function(context) {
-                                    return `${context.parsed.x.toFixed(4)} seconds`;
-                                }
-                            }
-                        }
-                    }
-                }
-            });
-        </script>
-        
-        <div class="footer">
-            <p>MySQL Database Benchmark Report - Generated on %s</p>
-        </div>
-    </body>
-    </html>
-    """ % (
-        # Chart labels
-        ', '.join([f"'{result['name']}'" for result in sorted_results]),
-        # Chart data
-        ', '.join([f"{result['avg_time']}" for result in sorted_results]),
-        # Chart background colors
-        ', '.join(["'rgba(255, 99, 132, 0.2)'" if result['avg_time'] > 1.0 else 
-                   "'rgba(255, 205, 86, 0.2)'" if result['avg_time'] > 0.1 else 
-                   "'rgba(75, 192, 192, 0.2)'" for result in sorted_results]),
-        # Chart border colors
-        ', '.join(["'rgb(255, 99, 132)'" if result['avg_time'] > 1.0 else 
-                   "'rgb(255, 205, 86)'" if result['avg_time'] > 0.1 else 
-                   "'rgb(75, 192, 192)'" for result in sorted_results]),
-        # Footer date
-        datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    )
+    stats.update(schema_stats)
+    return stats
+
+
+def generate_report(results, stats, output_file):
+    """Generate HTML benchmark report"""
+    # Sort results by average execution time (slowest first)
+    avg_times = np.array([result["avg_time"] for result in results])
+    order = np.argsort(-avg_times, kind="stable")
+    sorted_results = [results[i] for i in order]
+    
+    # Group results by category, keeping categories in benchmark order and
+    # the results within each category in sorted order
+    categorized_results = {result["category"]: [] for result in results}
+    for result in sorted_results:
+        categorized_results[result["category"]].append(result)
+    
+    # Calculate total data size
+    total_data_size = sum(table["data_length"] + table["index_length"] for table in stats["tables"])
+    
+    # Build the performance chart data in a single pass; it is embedded in the
+    # report as JSON
+    chart_data = {"labels": [], "data": [], "bgColors": [], "borderColors": []}
+    for result in sorted_results:
+        background_color, border_color = CHART_COLORS[performance_class(result["avg_time"])]
+        # Results timed by EXPLAIN ANALYZE are server-side times, unlike the
+        # client wall-clock times of the others, so label them in the chart
+        chart_data["labels"].append(result["name"] + (" (EXPLAIN)" if result["plan_time"] is not None else ""))
+        chart_data["data"].append(result["avg_time"])
+        chart_data["bgColors"].append(background_color)
+        chart_data["borderColors"].append(border_color)
     
-    with open(output_file, 'w') as f:
-        f.write(html)
+    # Render the HTML report; the template is compiled once per process and
+    # streamed to the file chunk by chunk rather than built up in memory
+    template = REPORT_ENV.get_template("report.html.j2")
+    if output_file.endswith('.gz'):
+        report_file = gzip.open(output_file, 'wt', encoding='utf-8', compresslevel=6)
+    else:
+        report_file = open(output_file, 'w', encoding='utf-8', buffering=1 << 16)
+    with report_file as f:
+        template.stream(
+            results=sorted_results,
+            categorized=categorized_results,
+            stats=stats,
+            general=GENERAL_SUGGESTIONS,
+            total_data_size=total_data_size,
+            chart_data=chart_data,
+            generated_at=datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        ).dump(f)
     
     print(f"Benchmark report generated: {output_file}")
 
 
+def performance_class(avg_time):
+    """Classify an average execution time as slow, medium or fast"""
+    if avg_time > 1.0:
+        return "slow"
+    elif avg_time > 0.1:
+        return "medium"
+    return "fast"
+
+
+def format_time(seconds):
+    """Format an optional duration in seconds for the report"""
+    return f"{seconds:.4f}" if seconds is not None else "N/A"
+
+
 def format_size(size_bytes):
     """Format size in bytes to human-readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0 or unit == 'TB':
-            break
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} {unit}"
+    if size_bytes <= 0:
+        return "0.00 B"
+    # Units are 2**10 apart, so the unit index follows from the bit length
+    unit_index = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit_index)):.2f} {SIZE_UNITS[unit_index]}"
+
+
+# Jinja2 environment for the HTML report. Templates are loaded from the
+# directory of this script and autoescaped, so query text and table or
+# column names cannot break the markup.
+REPORT_ENV = Environment(
+    loader=FileSystemLoader(os.path.dirname(os.path.abspath(__file__))),
+    autoescape=True,
+    trim_blocks=True,
+    lstrip_blocks=True
+)
+REPORT_ENV.filters["format_size"] = format_size
+REPORT_ENV.filters["format_time"] = format_time
+REPORT_ENV.filters["performance_class"] = performance_class
 
 
 def main():
-    parser = argparse.ArgumentParser(description="Benchmark MySQL database performance")
+    parser = argparse.ArgumentParser(description="Benchmark MySQL database performance", add_help=False)
     parser.add_argument("--host", type=str, default="localhost", help="MySQL host")
     parser.add_argument("--port", type=int, default=3306, help="MySQL port")
     parser.add_argument("--user", type=str, default="root", help="MySQL username")
     parser.add_argument("--password", type=str, help="MySQL password")
     parser.add_argument("--database", type=str, default="ecommerce_demo", help="Database name")
     parser.add_argument("--iterations", type=int, default=3, help="Number of iterations for each test")
-    parser.add_argument("--output", type=str, default="benchmark_report.html", help="Output report file")
+    parser.add_argument("--output", type=str, default="benchmark_report.html",
+                        help="Output report file (gzip-compressed if the name ends in .gz)")
+    parser.add_argument("--parallel", type=int, default=1,
+                        help="Number of queries to benchmark concurrently (max %d)" % pooling.CNX_POOL_MAXSIZE)
+    parser.add_argument("--cache-mode", choices=["cold", "warm", "mixed"], default="warm",
+                        help="Flush server caches before every iteration (cold), discard a warm-up run (warm), "
+                             "or flush once so only the first iteration is cold (mixed)")
+    parser.add_argument("--explain", action="store_true",
+                        help="Time each query with a single EXPLAIN ANALYZE run and include its plan in the report")
+    parser.add_argument("--no-stats-cache", action="store_true",
+                        help="Re-read database statistics even if the schema looks unchanged since the last run "
+                             "(e.g., after adding or dropping an index in place)")
     parser.add_argument("--help", action="store_true", help="Show help message")
     
     args = parser.parse_args()
@@ -794,6 +800,12 @@ def main():
         parser.print_help()
         sys.exit(0)
     
+    # FLUSH TABLES acts on the whole server, so flushing for one query would
+    # disturb the timings of the queries running alongside it
+    if args.parallel > 1 and args.cache_mode != "warm":
+        parser.error(f"--cache-mode {args.cache_mode} cannot be combined with --parallel; "
+                     "use --cache-mode warm or run serially")
+    
     # Get password if not provided
     password = args.password
     if password is None:
@@ -802,11 +814,24 @@ def main():
     print(f"Connecting to MySQL database {args.database} on {args.host}:{args.port}...")
     connection = connect_to_database(args.host, args.port, args.user, password, args.database)
     
-    print(f"Running benchmark with {args.iterations} iterations per query...")
-    results = run_benchmark(connection, args.iterations)
+    pool = None
+    if args.parallel > 1:
+        pool = create_connection_pool(args.host, args.port, args.user, password, args.database,
+                                      min(args.parallel, pooling.CNX_POOL_MAXSIZE))
     
+    # Statistics come from information_schema and do not depend on the benchmark,
+    # so they are collected on a second connection while the benchmark runs
     print("Collecting database statistics...")
-    stats = get_database_stats(connection)
+    stats_connection = connect_to_database(args.host, args.port, args.user, password, args.database)
+    with ThreadPoolExecutor(max_workers=1) as stats_executor:
+        stats_future = stats_executor.submit(get_cached_database_stats, stats_connection, args.host,
+                                             args.port, args.database, not args.no_stats_cache)
+        
+        print(f"Running benchmark with {args.iterations} iterations per query...")
+        results = run_benchmark(connection, args.iterations, pool, args.cache_mode, args.explain)
+        
+        stats = stats_future.result()
+    stats_connection.close()
     
     print("Generating benchmark report...")
     generate_report(results, stats, args.output)